@@ -22,7 +22,8 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-import base64
+import binascii
+from contextlib import ExitStack, contextmanager
 import copy
 from dataclasses import (
     _is_dataclass_instance,
@@ -32,8 +33,11 @@ from dataclasses import (
 )
 from datetime import date, datetime
 from enum import Enum
+import hashlib
 import json
+import math
 import mimetypes
+import mmap
 from pathlib import Path
 from shutil import copyfile
 from typing import Any, Dict, List
@@ -42,11 +46,20 @@ from urllib.parse import unquote
 import struct
 import warnings
 
-from dataclasses_json import dataclass_json as dataclass_json
-from dataclasses_json.core import _decode_dataclass
 from dataclasses_json.core import _ExtendedEncoder as JsonEncoder
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard library json module is used without it
+    orjson = None
+
+try:
+    import pybase64
+except ImportError:  # pybase64 is optional, the standard library binascii module is used without it
+    pybase64 = None
+
 from .types import *
+from .types import _numpy
 
 __version__ = "1.15.3"
 
@@ -113,9 +126,11 @@ class GLTF2(Property):
         """
         Decodes the binary portion of a data uri.
         """
-        data = uri.split(header or DATA_URI_HEADER)[1]
-        data = base64.decodebytes(bytes(data, "utf8"))
-        return data
+        header = header or DATA_URI_HEADER
+        start = uri.find(header)
+        if start == -1:
+            raise ValueError(f"Unable to decode data uri, it does not contain the header {header}")
+        return _b64decode(uri[start + len(header):])
 
     def identify_uri(self, uri):
         """
@@ -151,19 +166,44 @@ class GLTF2(Property):
         a binary blob), strip off any headers and do any conversions are return a universal binary
         blob for manipulation.
         """
-        current_buffer_format = self.identify_uri(uri)
+        return self._read_buffer_uri(uri, self.identify_uri(uri))
 
-        if current_buffer_format == BufferFormat.BINFILE:
+    def _read_buffer_uri(self, uri, buffer_format):
+        # get_data_from_buffer_uri for a uri that has already been identified
+        if buffer_format == BufferFormat.BINFILE:
             data = self.load_file_uri(uri)
-        elif current_buffer_format == BufferFormat.DATAURI:
+        elif buffer_format == BufferFormat.DATAURI:
             data = self.decode_data_uri(uri)
-        elif current_buffer_format == BufferFormat.BINARYBLOB:
+        elif buffer_format == BufferFormat.BINARYBLOB:
             data = self.binary_blob()
         else:
             return None
 
         return data
 
+    def get_accessor_array(self, accessor_index):
+        """
+        Return an accessor's data as a numpy array of shape (count, components), or (count,) for SCALAR accessors.
+
+        The array is a view over the buffer data rather than a copy, so it is read only when the data is bytes.
+        Requires numpy. Sparse substitution, normalization and matrix column padding are not applied.
+        """
+        np = _numpy()
+        if np is None:
+            raise ImportError("get_accessor_array requires numpy")
+        accessor = self.accessors[accessor_index]
+        components = ACCESSOR_TYPE_COMPONENTS[accessor.type]
+        dtype = np.dtype("<" + COMPONENT_TYPE_FORMATS[accessor.componentType])
+        shape = (accessor.count, components) if components > 1 else (accessor.count,)
+        if accessor.bufferView is None:  # no data, the values are zeros (unless sparse)
+            return np.zeros(shape, dtype=dtype)
+        buffer_view = self.bufferViews[accessor.bufferView]
+        data = self.get_data_from_buffer_uri(self.buffers[buffer_view.buffer].uri)
+        offset = (buffer_view.byteOffset or 0) + (accessor.byteOffset or 0)
+        stride = buffer_view.byteStride or dtype.itemsize * components
+        strides = (stride, dtype.itemsize) if components > 1 else (stride,)
+        return np.ndarray(shape, dtype=dtype, buffer=data, offset=offset, strides=strides)
+
     def append_to_buffer(self, array_bytes):
         buf_bytes = bytearray(self.binary_blob())
         old_buf_len = len(buf_bytes)
@@ -193,32 +233,27 @@ class GLTF2(Property):
         """
         bufferView = self.bufferViews.pop(buffer_view_id)
 
-        def update_obj(title, obj):
-
-            if not obj:
-                print(f"{obj} empty")
-
-            if not obj.bufferView:
-                return
-
-            if obj.bufferView == buffer_view_id:
+        def referencing_objects():
+            # (title format, index, object) for everything that can point at a bufferView
+            for i, accessor in enumerate(self.accessors):
+                yield "gltf.accessors[{}]", i, accessor
+                sparse = accessor.sparse
+                if sparse is not None:
+                    yield "gltf.accessors[{}].sparse.indices", i, sparse.indices
+                    yield "gltf.accessors[{}].sparse.values", i, sparse.values
+            for i, image in enumerate(self.images):
+                yield "gltf.images[{}]", i, image
+
+        for title, i, obj in referencing_objects():
+            index = getattr(obj, "bufferView", None)  # obj is None for a sparse accessor missing indices or values
+            if not index or index < buffer_view_id:
+                continue
+            if index == buffer_view_id:
                 warnings.warn(
                     f"Removing bufferView {buffer_view_id} but "
-                    f"{title}.bufferView still points to it. This may corrupt the GLTF."
+                    f"{title.format(i)}.bufferView still points to it. This may corrupt the GLTF."
                 )
-            if obj.bufferView >= buffer_view_id:
-                obj.bufferView -= 1
-
-        for i, accessor in enumerate(self.accessors):
-            update_obj(f"gltf.accessors[{i}]", accessor)
-            if accessor and accessor.sparse:
-                update_obj(
-                    f"gltf.accessors[{i}].sparse.indices", accessor.sparse.indices
-                )
-                update_obj(f"gltf.accessors[{i}].sparse.values", accessor.sparse.values)
-
-        for i, obj in enumerate(self.images):
-            update_obj(f"gltf.images[{i}]", obj)
+            obj.bufferView = index - 1
 
         def min_tuple(iterable):
             return min(enumerate(iterable), key=lambda x: x[1][1])[1]
@@ -272,7 +307,7 @@ class GLTF2(Property):
         if name:  # use image.name
             file_name = name
         else:
-            extension = mimetypes.guess_extension(mime)
+            extension = _guess_image_extension(mime)
             file_name = f"{index}{extension}"
         destination = Path(destination)
         if destination.is_dir():
@@ -284,7 +319,7 @@ class GLTF2(Property):
                 f"Unable to write image file, a file already exists at {image_path}"
             )
             return None
-        data = base64.b64decode(encoded)
+        data = _b64decode(encoded)
 
         with open(image_path, "wb") as image_file:
             image_file.write(data)
@@ -363,7 +398,7 @@ class GLTF2(Property):
             # Convert to new format
             ########################
             if target_format == ImageFormat.DATAURI:  # convert to data uri
-                encoded_string = str(base64.b64encode(image_bytes).decode("utf-8"))
+                encoded_string = _b64encode(image_bytes)
                 image.name = copy.copy(image.uri) if not image.name else image.name
                 image.uri = f"data:{image.mimeType};base64,{encoded_string}"
             elif target_format == ImageFormat.BUFFERVIEW:
@@ -392,7 +427,7 @@ class GLTF2(Property):
 
             elif target_format == ImageFormat.FILE:  # convert to images
 
-                extension = mimetypes.guess_extension(image.mimeType)
+                extension = _guess_image_extension(image.mimeType)
                 file_name = f"{image.name}{extension}"
                 image_path = path / file_name
 
@@ -427,7 +462,7 @@ class GLTF2(Property):
                 warnings.warn(
                     f"Conversion will leave {buffer.uri} file orphaned since data is now in the GLTF object."
                 )
-            data = self.get_data_from_buffer_uri(buffer.uri)
+            data = self._read_buffer_uri(buffer.uri, current_buffer_format)
 
             if not data:
                 return
@@ -445,8 +480,7 @@ class GLTF2(Property):
                 buffer.uri = None
             elif buffer_format == BufferFormat.DATAURI:
                 # convert buffer to a data uri
-                data = base64.b64encode(data).decode("utf-8")
-                buffer.uri = f"{DATA_URI_HEADER}{data}"
+                buffer.uri = DATA_URI_HEADER + _b64encode(data)
             elif buffer_format == BufferFormat.BINFILE:
                 filename = Path(f"{i}").with_suffix(".bin")
                 binfile_path = path / filename
@@ -475,12 +509,12 @@ class GLTF2(Property):
         """
         to_json and from_json from dataclasses_json
         courtesy https://github.com/lidatong/dataclasses-json
-        """
 
-        data = gltf_asdict(self)
-        data = delete_empty_keys(data)
+        Always uses the json module, so the text is the same whether or not orjson is installed
+        (orjson spells floats and dates differently). gltf_to_json_bytes uses orjson when it's available.
+        """
         return json.dumps(
-            data,
+            gltf_todict(self),
             cls=JsonEncoder,
             skipkeys=skipkeys,
             ensure_ascii=ensure_ascii,
@@ -504,23 +538,26 @@ class GLTF2(Property):
         infer_missing=False,
         **kw,
     ) -> A:
-        init_kwargs = json.loads(
-            s,
-            parse_float=parse_float,
-            parse_int=parse_int,
-            parse_constant=parse_constant,
-            **kw,
-        )
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", RuntimeWarning)
-            result = _decode_dataclass(cls, init_kwargs, infer_missing)  # type: GLTF2
-        for mesh in result.meshes:
-            for primitive in mesh.primitives:
-                raw_attributes = primitive.attributes
-                if raw_attributes:
-                    attributes = Attributes(**raw_attributes)
-                    primitive.attributes = attributes
-        return result
+        """
+        Create a GLTF2 object from a json document, given as a str or as utf-8 bytes (bytes, bytearray or memoryview).
+        """
+        init_kwargs = None
+        if orjson is not None and not (parse_float or parse_int or parse_constant or kw):
+            try:
+                init_kwargs = orjson.loads(s)
+            except orjson.JSONDecodeError:
+                pass  # eg NaN or huge ints, the json module accepts more than orjson
+        if init_kwargs is None:
+            if isinstance(s, memoryview):
+                s = s.tobytes()  # the json module reads str, bytes and bytearray
+            init_kwargs = json.loads(
+                s,
+                parse_float=parse_float,
+                parse_int=parse_int,
+                parse_constant=parse_constant,
+                **kw,
+            )
+        return gltf_fromdict(cls, init_kwargs, infer_missing)  # primitive attributes are decoded to Attributes too
 
     def gltf_to_json(self, separators=None, indent="  ") -> str:
         return self.to_json(
@@ -531,50 +568,95 @@ class GLTF2(Property):
             separators=separators,
         )
 
-    def save_json(self, fname):
-        path = Path(fname)
-        original_buffers = copy.deepcopy(self.buffers)
-        for i, buffer in enumerate(self.buffers):
-            if buffer.uri is None:  # save glb_data as bin file
-                # update the buffer uri to point to our new local bin file
-                glb_data = self.binary_blob()
-                if glb_data:
-                    buffer.uri = str(Path(path.stem).with_suffix(".bin"))
-                    with open(
-                        path.with_suffix(".bin"), "wb"
-                    ) as f:  # save bin file with the gltf file
-                        f.write(glb_data)
-                else:
-                    warnings.warn(f"buffer {i} is empty: {buffer}")
-
-        with open(path, "w") as f:
-            f.write(self.gltf_to_json())
+    def gltf_to_json_bytes(self, separators=None, indent="  ") -> bytes:
+        """
+        gltf_to_json as utf-8 bytes, ready to write to a file. orjson (if installed) produces the bytes directly.
+        """
+        option = _orjson_option(indent, separators, False)
+        if option is not None:
+            encoded = _orjson_dumps(gltf_todict(self), json_serial, option)
+            if encoded is not None:
+                return encoded
+        return self.gltf_to_json(separators=separators, indent=indent).encode("utf-8")
+
+    def save_json(self, fname, pretty=True):
+        """
+        Save as a .gltf file, with any binary blob written to a .bin file next to it.
 
-        self.buffers = original_buffers  # restore buffers
+        pretty=False writes compact json without indentation, which is smaller and quicker to produce.
+        """
+        path = Path(fname)
+        bin_buffers = []  # buffers pointed at the bin file while saving, uri is the only field changed
+        try:
+            for i, buffer in enumerate(self.buffers):
+                if buffer.uri is None:  # save glb_data as bin file
+                    # update the buffer uri to point to our new local bin file
+                    glb_data = self.binary_blob()
+                    if glb_data:
+                        buffer.uri = str(Path(path.stem).with_suffix(".bin"))
+                        bin_buffers.append(buffer)
+                        with open(
+                            path.with_suffix(".bin"), "wb"
+                        ) as f:  # save bin file with the gltf file
+                            f.write(glb_data)
+                    else:
+                        warnings.warn(f"buffer {i} is empty: {buffer}")
+
+            data = self.gltf_to_json_bytes() if pretty else self.gltf_to_json_bytes(separators=(",", ":"), indent=None)
+            with open(path, "wb") as f:
+                f.write(data)
+        finally:
+            for buffer in bin_buffers:  # restore buffers
+                buffer.uri = None
         return True
 
     def buffers_to_binary_blob(self):
         """Flatten all buffers into a single buffer"""
-        buffer_blob = bytearray()
+        with ExitStack() as stack:
+            return bytearray().join(self._binary_blob_segments(stack))
+
+    def _binary_blob_segments(self, stack, deduplicate=False):
+        """
+        Point every bufferView into a single buffer, without copying any data.
+
+        The segments and any memory maps of .bin files behind them are registered with stack (an ExitStack), so they
+        are released and closed when it exits rather than whenever they're garbage collected. Until then the maps
+        keep the .bin files open, which on Windows stops them being overwritten or deleted.
+
+        deduplicate=True points bufferViews with identical (padded) data, target and byteStride at one copy of it.
+
+        Returns
+            (list): memoryviews of each bufferView's padded data (and any zero fill),
+                in the order they make up the buffer
+        """
+        segments = []
+        seen = {}  # (digest, target, byteStride) of a segment -> (offset, segment) of its first copy
 
         offset = 0
         path = getattr(self, "_path", Path())
-        binary_blob: Optional[bytearray] = None
+        buffer_data = {}  # each buffer is read or decoded once, however many bufferViews point into it
 
         for i, bufferView in enumerate(self.bufferViews):
-            buffer = self.buffers[bufferView.buffer]
-            if buffer.uri is None:  # assume loaded from glb binary file
-                if binary_blob is None:
-                    binary_blob = self.binary_blob()
-                data = binary_blob
-            elif buffer.uri.startswith("data"):
-                data = self.decode_data_uri(buffer.uri)
-            elif Path(path, buffer.uri).is_file():
-                with open(Path(path, buffer.uri), "rb") as fb:
-                    data = fb.read()
+            if bufferView.buffer in buffer_data:
+                data = buffer_data[bufferView.buffer]
             else:
+                buffer = self.buffers[bufferView.buffer]
+                if buffer.uri is None:  # assume loaded from glb binary file
+                    data = self.binary_blob()
+                elif buffer.uri.startswith("data"):
+                    data = self.decode_data_uri(buffer.uri)
+                elif Path(path, buffer.uri).is_file():
+                    data = _open_mapped(Path(path, buffer.uri))  # only the bufferViews' bytes are ever read
+                    if isinstance(data, mmap.mmap):
+                        stack.enter_context(data)  # entered first, so closed after the views into it are released
+                else:
+                    data = None
+                if data is not None:
+                    data = stack.enter_context(memoryview(data))  # slice without copying
+                buffer_data[bufferView.buffer] = data
+            if data is None:
                 warnings.warn(
-                    f"Unable to save bufferView {buffer.uri[:20]} to glb, skipping. "
+                    f"Unable to save bufferView {str(self.buffers[bufferView.buffer].uri)[:20]} to glb, skipping. "
                     "Please open an issue at https://gitlab.com/dodgyville/pygltflib/issues"
                 )
                 continue
@@ -582,37 +664,63 @@ class GLTF2(Property):
                 bufferView.byteOffset if bufferView.byteOffset is not None else 0
             )
             byte_length = bufferView.byteLength
-            if byte_length % 4 != 0:  # pad each segment of binary blob
-                byte_length += 4 - byte_length % 4
-
-            buffer_blob += data[byte_offset : byte_offset + byte_length]
+            byte_length += -byte_length & 3  # pad each segment of binary blob to a multiple of 4
+
+            segment = stack.enter_context(data[byte_offset : byte_offset + byte_length])
+            if deduplicate and segment.nbytes == byte_length:
+                # views used differently (eg index and vertex data) must stay apart, validators reject them sharing
+                key = (hashlib.blake2b(segment, digest_size=16).digest(), bufferView.target, bufferView.byteStride)
+                first_offset, first_segment = seen.setdefault(key, (offset, segment))
+                if first_offset != offset and first_segment == segment:
+                    bufferView.byteOffset = first_offset
+                    bufferView.byteLength = byte_length
+                    bufferView.buffer = 0
+                    continue
+            segments.append(segment)
+            if segment.nbytes < byte_length:  # data ends inside the padding, zero fill so later offsets stay right
+                segments.append(memoryview(bytes(byte_length - segment.nbytes)))
 
             bufferView.byteOffset = offset
             bufferView.byteLength = byte_length
             bufferView.buffer = 0
             offset += byte_length
 
-        return buffer_blob
+        return segments
+
+    def _glb_chunks(self, stack, deduplicate=False):
+        """
+        Pack the bufferViews into one buffer, serialize the json chunk for it, then restore the bufferViews.
+
+        The segments are only valid until stack exits, see _binary_blob_segments.
 
-    def save_to_bytes(self):
-        # setup
-        original_buffer_views = copy.deepcopy(self.bufferViews)
-        original_buffers = copy.deepcopy(self.buffers)
+        Returns
+            (bytes, list): the padded json chunk and the segments of the binary chunk
+        """
+        # only these bufferView fields are changed while packing, so they are all that needs restoring
+        original_buffer_views = [(view.buffer, view.byteOffset, view.byteLength) for view in self.bufferViews]
+        original_buffers = self.buffers  # replaced below, not changed
         new_buffer = Buffer()
 
-        buffer_blob = self.buffers_to_binary_blob()
-        new_buffer.byteLength = len(buffer_blob)
+        try:
+            segments = self._binary_blob_segments(stack, deduplicate)
+            new_buffer.byteLength = sum(segment.nbytes for segment in segments)
 
-        self.buffers = [new_buffer]
-        json_blob = self.gltf_to_json(separators=(",", ":"), indent=None).encode(
-            "utf-8"
-        )
+            self.buffers = [new_buffer]
+            json_blob = self.gltf_to_json_bytes(separators=(",", ":"), indent=None)
+        finally:
+            # restore unpacked bufferViews
+            for view, (buffer, byte_offset, byte_length) in zip(self.bufferViews, original_buffer_views):
+                view.buffer, view.byteOffset, view.byteLength = buffer, byte_offset, byte_length
+            self.buffers = original_buffers  # restore unpacked buffers
 
-        # pad each blob if needed
-        if len(json_blob) % 4 != 0:
-            json_blob += b"   "[0 : 4 - len(json_blob) % 4]
+        # pad the json chunk with spaces to a multiple of 4, as the spec requires
+        json_blob += b"   "[: -len(json_blob) & 3]
+        return json_blob, segments
 
-        version = struct.pack("<I", GLTF_VERSION)
+    @staticmethod
+    def _glb_header(json_blob, buffer_blob_length):
+        """The components of a glb up to the binary chunk data"""
+        version = _UINT32.pack(GLTF_VERSION)
         chunk_header_len = 8
         length = (
             len(MAGIC)
@@ -620,50 +728,66 @@ class GLTF2(Property):
             + 4
             + chunk_header_len * 2
             + len(json_blob)
-            + len(buffer_blob)
+            + buffer_blob_length
         )
 
-        self.bufferViews = original_buffer_views  # restore unpacked bufferViews
-        self.buffers = original_buffers  # restore unpacked buffers
-
         # header is MAGIC, version, length
         # json chunk is json_blob length, JSON, json_blob
         # buffer chunk is length of buffer_blob, utf-8, buffer_blob
         return [
             MAGIC,
             version,
-            struct.pack("<I", length),
-            struct.pack("<I", len(json_blob)),
-            bytes(JSON, "utf-8"),
+            _UINT32.pack(length),
+            _UINT32.pack(len(json_blob)),
+            _JSON_CHUNK_TYPE,
             json_blob,
-            struct.pack("<I", len(buffer_blob)),
-            bytes(BIN, "utf-8"),
-            buffer_blob,
+            _UINT32.pack(buffer_blob_length),
+            _BIN_CHUNK_TYPE,
         ]
 
-    def save_binary(self, fname):
-        with open(fname, "wb") as f:
-            glb_structure = self.save_to_bytes()
-            if not glb_structure:
-                return False
-            for data in glb_structure:
-                f.write(data)
+    def save_to_bytes(self, deduplicate=False):
+        with ExitStack() as stack:
+            json_blob, segments = self._glb_chunks(stack, deduplicate)
+            buffer_blob = bytearray().join(segments)
+        return self._glb_header(json_blob, len(buffer_blob)) + [buffer_blob]
+
+    def save_binary(self, fname, deduplicate=False):
+        """
+        Save as a .glb file, packing every buffer into its binary chunk.
+
+        deduplicate=True stores bufferViews with identical data, target and byteStride once, with all of them
+        pointing at the one copy. The bufferViews in the saved file then overlap, which remove_bufferView does not
+        handle: it assumes disjoint bufferViews and would corrupt the offsets of a loaded deduplicated file.
+        """
+        # the bufferViews are written straight from their buffers, the binary chunk is never assembled in memory
+        with ExitStack() as stack:  # closes any .bin files mapped for the segments once they are written
+            json_blob, segments = self._glb_chunks(stack, deduplicate)
+            # a large write buffer groups many small bufferViews into few writes, big ones go straight through
+            with open(fname, "wb", buffering=_GLB_WRITE_BUFFER_SIZE) as f:
+                f.writelines(self._glb_header(json_blob, sum(segment.nbytes for segment in segments)))
+                f.writelines(segments)
         return True
 
-    def save(self, fname, asset=Asset()):
-        self.asset = asset
-        self._path = Path(fname).parent
-        self._name = Path(fname).name
-        ext = Path(fname).suffix
-        if ext.lower() in [".glb"]:
-            return self.save_binary(fname)
+    def save(self, fname, asset=None, pretty=True, deduplicate=False):
+        """
+        Save as a .glb or .gltf file, depending on the suffix of fname.
+
+        pretty applies to .gltf files (see save_json), deduplicate to .glb files (see save_binary). A deduplicated
+        .glb has overlapping bufferViews, so don't use remove_bufferView on it once loaded.
+        """
+        self.asset = Asset() if asset is None else asset  # a new Asset each call, a shared default would leak edits
+        path = Path(fname)
+        self._path = path.parent
+        self._name = path.name
+        if path.suffix.lower() == ".glb":
+            return self.save_binary(fname, deduplicate=deduplicate)
         else:
             if getattr(self, "_glb_data", None):
                 warnings.warn(
                     f"This file ({fname}) contains a binary blob loaded from a .glb file, "
                     "and this will be saved to a .bin file next to the json file."
                 )
-            return self.save_json(fname)
+            return self.save_json(fname, pretty=pretty)
 
     @classmethod
     def gltf_from_json(cls, json_data):
@@ -671,15 +795,14 @@ class GLTF2(Property):
 
     @classmethod
     def load_json(cls, fname):
-        with open(fname, "r") as f:
-            obj = cls.gltf_from_json(f.read())
+        with _map_file(fname) as data, memoryview(data) as view:
+            obj = cls.gltf_from_json(view)
         return obj
 
     @classmethod
     def load_from_bytes(cls, data):
-        magic = struct.unpack("<BBBB", data[:4])
-        version, length = struct.unpack("<II", data[4:12])
-        if bytearray(magic) != MAGIC:
+        magic, version, length = _GLB_HEADER.unpack_from(data)
+        if magic != MAGIC:
             raise IOError(
                 "Unable to load binary gltf file. Header does not appear to be valid glb format."
             )
@@ -694,20 +817,16 @@ class GLTF2(Property):
         i = 0
         obj = None
         while index < length:
-            chunk_length = struct.unpack("<I", data[index : index + 4])[0]
-            index += 4
-            chunk_type = bytearray(
-                struct.unpack("<BBBB", data[index : index + 4])
-            ).decode()
-            index += 4
-            if chunk_type not in [JSON, BIN]:
+            chunk_length, chunk_type = _CHUNK_HEADER.unpack_from(data, index)
+            index += 8
+            if chunk_type not in (_JSON_CHUNK_TYPE, _BIN_CHUNK_TYPE):
                 warnings.warn(
-                    f"Ignoring chunk {i} with unknown type '{chunk_type}', probably glTF extensions. "
+                    f"Ignoring chunk {i} with unknown type '{chunk_type.decode()}', probably glTF extensions. "
                     "Please open an issue at https://gitlab.com/dodgyville/pygltflib/issues"
                 )
-            elif chunk_type == JSON:
-                raw_json = data[index : index + chunk_length].decode("utf-8")
-                obj = cls.from_json(raw_json, infer_missing=True)
+            elif chunk_type == _JSON_CHUNK_TYPE:
+                with memoryview(data)[index : index + chunk_length] as raw_json:
+                    obj = cls.from_json(raw_json, infer_missing=True)
             else:
                 obj.set_binary_blob(data[index : index + chunk_length])
             index += chunk_length
@@ -716,9 +835,8 @@ class GLTF2(Property):
 
     @classmethod
     def load_binary(cls, fname):
-        with open(fname, "rb") as f:
-            data = f.read()
-        return cls.load_from_bytes(data)
+        with _map_file(fname) as data:
+            return cls.load_from_bytes(data)
 
     @classmethod
     def load_binary_from_file_object(cls, f):
@@ -738,6 +856,129 @@ class GLTF2(Property):
         return obj
 
 
+@contextmanager
+def _map_file(fname):
+    """
+    Open a file for reading as a read only memory map, so it can be parsed without reading a copy into memory.
+
+    Files that can't be mapped (eg empty files) are read normally.
+    """
+    data = _open_mapped(fname)
+    if not isinstance(data, mmap.mmap):
+        yield data
+        return
+    with data:
+        yield data
+
+
+def _open_mapped(fname):
+    """
+    Return a read only memory map of a file, or its contents if it can't be mapped (eg empty files).
+
+    The map stays open until it is closed or no longer referenced, the file itself is closed straight away.
+    """
+    with open(fname, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return f.read()
+
+
+def _orjson_option(indent, separators, sort_keys):
+    """
+    Map json.dumps formatting arguments to orjson options, for utf-8 byte output (gltf_to_json_bytes).
+
+    Returns
+        (int|None): orjson option flags, or None if orjson is unavailable or can't produce the same layout
+    """
+    if orjson is None:
+        return None
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent is None:
+        if separators is None or tuple(separators) != (",", ":"):
+            return None
+    elif indent in (2, "  "):
+        if separators is not None and tuple(separators) != (",", ": "):
+            return None
+        option |= orjson.OPT_INDENT_2
+    else:
+        return None
+    return option
+
+
+def _orjson_dumps(data, default, option):
+    """
+    Encode data with orjson, or return None to leave it to the json module.
+
+    orjson writes NaN and Infinity as null where the json module writes them out (or raises with allow_nan=False),
+    so data holding them is left to the json module. Only output containing null can hold one, the data is
+    searched for them just then.
+    """
+    try:
+        encoded = orjson.dumps(data, default=default, option=option)
+    except orjson.JSONEncodeError:
+        return None  # let the json module serialize (or report) what orjson can't handle
+    if b"null" in encoded and _has_non_finite(data):
+        return None
+    return encoded
+
+
+def _has_non_finite(data):
+    """
+    Whether data holds a NaN or infinite float, or a value orjson only encodes through default (which may be one).
+    """
+    stack = [data]  # iterative, documents can nest deeper than the recursion limit
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif value is not None and not isinstance(value, (str, int)):
+            return True
+    return False
+
+
+# glb header fields and chunk types, compiled and packed once here rather than per load or save
+_UINT32 = struct.Struct("<I")
+_GLB_HEADER = struct.Struct("<4sII")  # magic, version, length
+_CHUNK_HEADER = struct.Struct("<I4s")  # chunk length, chunk type
+_GLB_WRITE_BUFFER_SIZE = 1 << 20
+_JSON_CHUNK_TYPE = JSON.encode("utf-8")
+_BIN_CHUNK_TYPE = BIN.encode("utf-8")
+
+
+def _b64decode(data):
+    """
+    Decode base64 data, skipping newlines and any other characters outside the alphabet (like base64.decodebytes).
+
+    The data may be an ascii str, which is decoded as is rather than first being copied to bytes.
+    """
+    if pybase64 is not None:
+        return pybase64.b64decode(data, validate=False)
+    return binascii.a2b_base64(data)
+
+
+def _b64encode(data):
+    """Encode data as a base64 str, as base64.b64encode(data).decode() does"""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+# file extensions for the glTF image types, so saving images doesn't depend on the platform's mimetypes database
+_IMAGE_EXTENSIONS = {IMAGEJPEG: ".jpg", IMAGEPNG: ".png"}
+
+
+def _guess_image_extension(mime):
+    return _IMAGE_EXTENSIONS.get(mime) or mimetypes.guess_extension(mime)
+
+
 def main():
     import doctest
 
@@ -24,18 +24,35 @@ SOFTWARE.
 """
 import copy
 import json
-
+import struct
+import sys
 import warnings
-from dataclasses import _is_dataclass_instance, dataclass, field, fields
+from dataclasses import _is_dataclass_instance, dataclass, field, fields, is_dataclass
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, get_type_hints
 from urllib.parse import unquote
 
 from dataclasses_json import dataclass_json as dataclass_json
-from dataclasses_json.core import _decode_dataclass
 from dataclasses_json.core import _ExtendedEncoder as JsonEncoder
 
+np = None  # numpy is optional, it speeds up working with buffer data when installed. See _numpy
+_numpy_imported = False
+
+
+def _numpy():
+    # import numpy the first time buffer data needs it rather than on every ``import pygltflib``, it is slow to import
+    global np, _numpy_imported
+    if not _numpy_imported:
+        _numpy_imported = True
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+    return np
+
+
 __version__ = "1.15.3"
 
 """
@@ -63,6 +80,9 @@ MAT2 = "MAT2"
 MAT3 = "MAT3"
 MAT4 = "MAT4"
 
+# number of components in each element of an accessor type
+ACCESSOR_TYPE_COMPONENTS = {SCALAR: 1, VEC2: 2, VEC3: 3, VEC4: 4, MAT2: 4, MAT3: 9, MAT4: 16}
+
 BYTE = 5120
 UNSIGNED_BYTE = 5121
 SHORT = 5122
@@ -71,6 +91,14 @@ UNSIGNED_INT = 5125
 FLOAT = 5126
 
 COMPONENT_TYPES = [BYTE, UNSIGNED_BYTE, SHORT, UNSIGNED_SHORT, UNSIGNED_INT, FLOAT]
+# struct (and numpy) format character for each component type, buffer data is little endian
+COMPONENT_TYPE_FORMATS = {BYTE: "b", UNSIGNED_BYTE: "B", SHORT: "h", UNSIGNED_SHORT: "H", UNSIGNED_INT: "I", FLOAT: "f"}
+# precompiled struct for one element of each (componentType, accessor type), eg ACCESSOR_STRUCTS[FLOAT, VEC3] is "<fff"
+ACCESSOR_STRUCTS = {
+    (component_type, accessor_type): struct.Struct("<" + component_format * components)
+    for component_type, component_format in COMPONENT_TYPE_FORMATS.items()
+    for accessor_type, components in ACCESSOR_TYPE_COMPONENTS.items()
+}
 ACCESSOR_SPARSE_INDICES_COMPONENT_TYPES = [UNSIGNED_BYTE, UNSIGNED_SHORT, UNSIGNED_INT]
 
 # MESH PRIMITIVE MODES
@@ -162,6 +190,11 @@ GLTF_MAX_VERSION = 2  # maximum supported version this library can load
 
 DATA_URI_HEADER = "data:application/octet-stream;base64,"
 
+# slots keep the many small objects (nodes, accessors, bufferViews...) in a large scene compact.
+# dataclass can generate them from python 3.10, older versions use regular classes.
+# With slots, setting an attribute that isn't a field raises AttributeError; custom data belongs in extras.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class BufferFormat(Enum):
     DATAURI = "data uri"
@@ -191,17 +224,31 @@ def delete_empty_keys(dictionary):
     Courtesy Chris Morgan and modified from:
     https://stackoverflow.com/questions/4255400/exclude-empty-null-values-from-json-serialization
     """
-    for key, value in list(dictionary.items()):
-        if value is None or (hasattr(value, "__iter__") and len(value) == 0):
-            del dictionary[key]
-        elif isinstance(value, dict) and key != "extensions":
-            # delete empty dicts except when the dictionary is an extension inside "extensions".
-            # The extension exemption is because we use dicts for extensions instead of dataclass objects
-            delete_empty_keys(value)
-        elif isinstance(value, list):
-            for item in value:
-                if isinstance(item, dict):
-                    delete_empty_keys(item)
+    stack = [dictionary]  # walk with a stack rather than recursion, glTF scenes can hold many thousands of dicts
+    while stack:
+        current = stack.pop()
+        for key, value in list(current.items()):
+            if value is None:
+                del current[key]
+            elif isinstance(value, dict):
+                if not value:
+                    del current[key]
+                elif key != "extensions":
+                    # delete empty dicts except when the dictionary is an extension inside "extensions".
+                    # The extension exemption is because we use dicts for extensions instead of dataclass objects
+                    stack.append(value)
+            elif isinstance(value, list):
+                if not value:
+                    del current[key]
+                else:
+                    stack.extend(item for item in value if isinstance(item, dict))
+            elif isinstance(value, (int, float)):
+                continue
+            elif isinstance(value, str):
+                if not value:
+                    del current[key]
+            elif hasattr(value, "__iter__") and len(value) == 0:
+                del current[key]
     return dictionary  # For convenience
 
 
@@ -221,14 +268,16 @@ def gltf_asdict(obj, *, dict_factory=dict):
 
 def _asdict_inner(obj, dict_factory):
     # return the same result as dataclass _asdict_inner except for Attributes, which can have custom specifiers.
+    if type(obj) in _PLAIN_TYPES:  # immutable, deepcopy would return the same object
+        return obj
     if type(obj) == Attributes:
-        return copy.deepcopy(obj.__dict__)
-    if _is_dataclass_instance(obj):
-        result = []
-        for f in fields(obj):
-            value = _asdict_inner(getattr(obj, f.name), dict_factory)
-            result.append((f.name, value))
-        return dict_factory(result)
+        return {
+            key: value if type(value) in _PLAIN_TYPES else copy.deepcopy(value) for key, value in obj.__dict__.items()
+        }
+    schema = _schema(type(obj))
+    if schema is not None:
+        names, getter = schema
+        return dict_factory([(name, _asdict_inner(value, dict_factory)) for name, value in zip(names, getter(obj))])
     elif isinstance(obj, tuple) and hasattr(obj, "_fields"):
         return type(obj)(*[_asdict_inner(v, dict_factory) for v in obj])
     elif isinstance(obj, (list, tuple)):
@@ -243,15 +292,328 @@ def _asdict_inner(obj, dict_factory):
         return copy.deepcopy(obj)
 
 
+# class -> (field names, getter returning the field values as a tuple), or None for classes that aren't dataclasses.
+# The emitter and decoder below bind these module level caches to locals in their loops.
+_SCHEMAS = {}
+_PLAIN_TYPES = frozenset((int, float, bool, str, type(None)))  # list items that are output as they are
+
+
+def _schema(cls):
+    try:
+        return _SCHEMAS[cls]
+    except KeyError:
+        schema = None
+        if hasattr(cls, "__dataclass_fields__"):
+            names = tuple(f.name for f in fields(cls))
+            if len(names) > 1:
+                getter = attrgetter(*names)
+            else:  # attrgetter only returns a tuple for two or more attributes
+                getter = lambda obj: tuple(getattr(obj, name) for name in names)  # noqa: E731
+            schema = (names, getter)
+        _SCHEMAS[cls] = schema
+        return schema
+
+
+def gltf_todict(obj):
+    """
+    Convert a dataclass object to a dict with the empty keys removed.
+
+    Gives the same result as ``delete_empty_keys(gltf_asdict(obj))`` in a single pass over the object, without
+    building and then pruning a deep copy. Values are not copied, so treat the result as read only.
+    """
+    if _schema(type(obj)) is None:
+        raise TypeError("gltf_todict() should be called on dataclass instances")
+    return _todict_object(obj, {})
+
+
+def _todict_object(obj, memo):
+    # convert a dataclass object with its class's generated function, see _compile_todict
+    cls = type(obj)
+    todict = _TODICT[cls] if cls in _TODICT else _compile_todict(cls)
+    return todict(obj, memo)
+
+
+def _todict_inner(items, memo):
+    # build a dict from (key, value) pairs, applying the delete_empty_keys rules as we go.
+    # memo maps id(Attributes) to its output so an Attributes object used by several primitives is converted once.
+    schemas = _SCHEMAS
+    plain_types = _PLAIN_TYPES
+    result = {}
+    for key, value in items:
+        cls = type(value)
+        if cls is int or cls is float or cls is bool:
+            result[key] = value
+            continue
+        if value is None:
+            continue
+        if cls is str:
+            if value:
+                result[key] = value
+            continue
+        if cls is list:
+            if value:
+                result[key] = [item if type(item) in plain_types else _todict_item(item, memo) for item in value]
+            continue
+        if isinstance(value, Attributes):
+            if value.__dict__:
+                result[key] = dict(value.__dict__) if key == "extensions" else _attributes_todict(value, memo)
+            continue
+        schema = schemas[cls] if cls in schemas else _schema(cls)
+        if schema is not None:
+            names, getter = schema
+            if names:
+                result[key] = (
+                    dict(zip(names, [_convert(v) for v in getter(value)]))
+                    if key == "extensions"
+                    else _todict_object(value, memo)
+                )
+            continue
+        if isinstance(value, dict):
+            if value:
+                # extensions are kept as they are, the same exemption as delete_empty_keys
+                result[key] = _convert(value) if key == "extensions" else _todict_inner(value.items(), memo)
+            continue
+        if isinstance(value, list):
+            if value:
+                result[key] = [item if type(item) in plain_types else _todict_item(item, memo) for item in value]
+            continue
+        if hasattr(value, "__iter__") and len(value) == 0:
+            continue
+        result[key] = _convert(value)
+    return result
+
+
+def _todict_item(item, memo):
+    # items in a list are pruned if they are (or become) dicts, anything else is kept as is
+    if isinstance(item, Attributes):
+        return _attributes_todict(item, memo)
+    if _schema(type(item)) is not None:
+        return _todict_object(item, memo)
+    if isinstance(item, dict):
+        return _todict_inner(item.items(), memo)
+    return _convert(item)
+
+
+def _attributes_todict(attributes, memo):
+    # the objects are kept alive by the tree being converted, so their ids can't be reused during the conversion
+    key = id(attributes)
+    if key not in memo:
+        memo[key] = _todict_inner(attributes.__dict__.items(), memo)
+    return memo[key]
+
+
+def _convert(obj):
+    # the gltf_asdict conversion without removing empty keys and without copying plain values
+    if isinstance(obj, Attributes):
+        return dict(obj.__dict__)
+    schema = _schema(type(obj))
+    if schema is not None:
+        names, getter = schema
+        return dict(zip(names, [_convert(v) for v in getter(obj)]))
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return type(obj)(*[_convert(v) for v in obj])
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_convert(v) for v in obj)
+    if isinstance(obj, dict):
+        return type(obj)((_convert(k), _convert(v)) for k, v in obj.items())
+    if hasattr(obj, "tolist"):  # numpy arrays and scalars, array.array
+        return obj.tolist()
+    return obj
+
+
+_TODICT = {}  # class -> generated function(obj, memo) that converts an object to a pruned dict
+
+
+def _compile_todict(cls):
+    # generate a straight line block per field, like _compile_fromdict, with a fast path for the type the field is
+    # declared as. Values of any other type go through _todict_inner, so the result is always the same.
+    names, _ = _schema(cls)
+    decoders = _field_decoders(cls)
+    namespace = {
+        "dict": dict, "int": int, "float": float, "bool": bool, "str": str, "list": list,
+        "plain_types": _PLAIN_TYPES, "_convert": _convert, "_todict_inner": _todict_inner,
+        "_todict_item": _todict_item, "_todict_object": _todict_object,
+    }
+    lines = ["def todict(obj, memo):", "    result = {}"]
+    for i, name in enumerate(names):
+        decoder = decoders.get(name)
+        kind, type_ = decoder if decoder is not None else (None, None)
+        key = repr(name)
+        if kind == _SCALAR and type_ is str:
+            fast = ["if cls is str:", "    if value:", f"        result[{key}] = value"]
+        elif kind == _SCALAR:
+            fast = ["if cls is int or cls is float or cls is bool:", f"    result[{key}] = value"]
+        elif kind == _OBJECT_LIST:
+            namespace[f"type_{i}"] = type_
+            fast = [
+                "if cls is list:",
+                "    if value:",
+                f"        result[{key}] = [_todict_object(item, memo) if type(item) is type_{i} else item"
+                " if type(item) in plain_types else _todict_item(item, memo) for item in value]",
+            ]
+        elif kind in (_SCALAR_LIST, _LIST):
+            fast = [
+                "if cls is list:",
+                "    if value:",
+                f"        result[{key}] = [item if type(item) in plain_types else _todict_item(item, memo)"
+                " for item in value]",
+            ]
+        elif kind == _DICT:
+            convert = "_convert(value)" if name == "extensions" else "_todict_inner(value.items(), memo)"
+            fast = ["if cls is dict:", "    if value:", f"        result[{key}] = {convert}"]
+        elif kind == _OBJECT and name != "extensions":
+            namespace[f"type_{i}"] = type_
+            fast = [f"if cls is type_{i}:", f"    result[{key}] = _todict_object(value, memo)"]
+        else:
+            fast = []
+        lines.append(f"    value = obj.{name}")
+        lines.append("    if value is not None:")
+        lines.append("        cls = type(value)")
+        lines.extend("        " + line for line in fast)
+        if fast:
+            lines.append("        else:")
+        lines.append(f"{'            ' if fast else '        '}result.update(_todict_inner((({key}, value),), memo))")
+    lines.append("    return result")
+    exec("\n".join(lines), namespace)
+    _TODICT[cls] = namespace["todict"]
+    return namespace["todict"]
+
+
+# how gltf_fromdict converts a json value to a field's type
+_SCALAR = 0  # int, float, str or bool
+_SCALAR_LIST = 1
+_OBJECT = 2  # a dataclass
+_OBJECT_LIST = 3
+_DICT = 4
+_LIST = 5  # any other list, items decoded with the item decoder if there is one
+_ATTRIBUTES = 6  # a primitive's attributes, a non-empty dict becomes an Attributes object
+
+_FIELD_DECODERS = {}  # class -> {field name: (kind, type) or None to use the value as it is}
+_FROM_DICT = {}  # class -> generated function(data, infer_missing) that builds an object, see _compile_fromdict
+
+
+def gltf_fromdict(cls, data, infer_missing=False):
+    """
+    Create a dataclass object from a dict (eg the output of json.loads).
+
+    A direct replacement for dataclasses_json's ``_decode_dataclass``: the field types are resolved once per class
+    rather than on every call. Unknown keys are ignored, missing keys get the field defaults, nested dataclasses are
+    decoded and int/float/str/bool values are converted to the annotated type just as ``_decode_dataclass`` does.
+    """
+    if isinstance(data, cls):
+        return data
+    if data is None and infer_missing:
+        data = {}
+    elif type(data) is not dict:
+        data = dict(data.items())
+    from_dict = _FROM_DICT[cls] if cls in _FROM_DICT else _compile_fromdict(cls)
+    return from_dict(data, infer_missing)
+
+
+def _compile_fromdict(cls):
+    # generate a function with a straight line block per field, the way dataclasses generates __init__,
+    # so decoding an object doesn't need to look up and dispatch on each field's decoder.
+    namespace = {
+        "cls": cls, "is_dataclass": is_dataclass, "gltf_fromdict": gltf_fromdict, "_decode": _decode,
+        "constants": _CONSTANTS,
+    }
+    constant_fields = _CONSTANT_FIELDS.get(cls, ())
+    lines = ["def from_dict(data, infer_missing):", "    kwargs = {}"]
+    for i, (name, decoder) in enumerate(_field_decoders(cls).items()):
+        lines.append(f"    if {name!r} in data:")
+        lines.append(f"        value = data[{name!r}]")
+        if decoder is None:
+            lines.append(f"        kwargs[{name!r}] = value")
+            continue
+        kind, namespace[f"type_{i}"], namespace[f"decoder_{i}"] = decoder[0], decoder[1], decoder
+        if kind == _SCALAR and name in constant_fields:
+            # share the constant's str object rather than keeping a copy per object
+            value = (
+                f"constants.get(value, value) if type(value) is str else value if value is None else type_{i}(value)"
+            )
+        elif kind == _SCALAR:
+            value = f"value if value is None or isinstance(value, type_{i}) else type_{i}(value)"
+        elif kind == _SCALAR_LIST:
+            value = f"value if value is None else [v if isinstance(v, type_{i}) else type_{i}(v) for v in value]"
+        elif kind == _OBJECT:
+            value = f"value if value is None or is_dataclass(value) else gltf_fromdict(type_{i}, value, infer_missing)"
+        elif kind == _ATTRIBUTES:
+            value = f"type_{i}(**value) if value else value"
+        else:
+            value = f"value if value is None else _decode(decoder_{i}, value, infer_missing)"
+        lines.append(f"        kwargs[{name!r}] = {value}")
+    lines.append("    return cls(**kwargs)")
+    exec("\n".join(lines), namespace)
+    _FROM_DICT[cls] = namespace["from_dict"]
+    return namespace["from_dict"]
+
+
+def _decode(decoder, value, infer_missing):
+    kind, type_ = decoder
+    if kind == _SCALAR_LIST:
+        return [item if isinstance(item, type_) else type_(item) for item in value]
+    if kind == _OBJECT_LIST:
+        return [
+            item if item is None or is_dataclass(item) else gltf_fromdict(type_, item, infer_missing)
+            for item in value
+        ]
+    if kind == _OBJECT:
+        return value if is_dataclass(value) else gltf_fromdict(type_, value, infer_missing)
+    if kind == _SCALAR:
+        return value if isinstance(value, type_) else type_(value)
+    if kind == _DICT:
+        return dict(value.items())
+    if type_ is None:  # _LIST
+        return list(value)
+    return [_decode(type_, item, infer_missing) for item in value]
+
+
+def _field_decoders(cls):
+    try:
+        return _FIELD_DECODERS[cls]
+    except KeyError:
+        hints = get_type_hints(cls)
+        decoders = {f.name: _type_decoder(hints[f.name]) for f in fields(cls) if f.init}
+        _FIELD_DECODERS[cls] = decoders
+        return decoders
+
+
+def _type_decoder(type_):
+    # return the (kind, type) gltf_fromdict uses to convert a json value to type_, or None to use the value as it is
+    origin = getattr(type_, "__origin__", None)
+    args = getattr(type_, "__args__", None) or ()
+    if origin is Union:
+        args = [arg for arg in args if arg is not type(None)]
+        return _type_decoder(args[0]) if len(args) == 1 else None
+    if origin in (list, List):
+        item_decoder = _type_decoder(args[0]) if args else None
+        if item_decoder is not None and item_decoder[0] == _ATTRIBUTES:
+            item_decoder = None  # morph targets stay as dicts
+        if item_decoder is not None and item_decoder[0] == _SCALAR:
+            return _SCALAR_LIST, item_decoder[1]
+        if item_decoder is not None and item_decoder[0] == _OBJECT:
+            return _OBJECT_LIST, item_decoder[1]
+        return _LIST, item_decoder
+    if origin in (dict, Dict):
+        return _DICT, None
+    if is_dataclass(type_):
+        return _OBJECT, type_
+    if type_ in (int, float, str, bool):
+        return _SCALAR, type_
+    if type_ is Attributes:
+        return _ATTRIBUTES, type_
+    return None
+
+
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Property:
     extensions: Optional[Dict[str, Any]] = field(default_factory=dict)
     extras: Optional[Dict[str, Any]] = field(default_factory=dict)
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Asset(Property):
     generator: Optional[str] = f"pygltflib@v{__version__}"
     copyright: Optional[str] = None
@@ -295,8 +657,7 @@ class Attributes:
 
     def to_json(self, *args, **kwargs):
         # Attributes objects can have custom attrs, so use our own json conversion methods.
-        data = copy.deepcopy(self.__dict__)
-        return json.dumps(data)
+        return json.dumps(self.__dict__)
 
     @staticmethod
     def from_json():
@@ -307,7 +668,7 @@ class Attributes:
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Primitive(Property):
     attributes: Attributes = field(default_factory=Attributes)  # required
     indices: Optional[int] = None
@@ -317,7 +678,7 @@ class Primitive(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Mesh(Property):
     primitives: List[Primitive] = field(default_factory=list)  # required
     weights: Optional[List[float]] = field(default_factory=list)
@@ -325,7 +686,7 @@ class Mesh(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AccessorSparseIndices(Property):
     bufferView: int = None  # required
     byteOffset: Optional[int] = 0
@@ -333,14 +694,14 @@ class AccessorSparseIndices(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AccessorSparseValues(Property):
     bufferView: int = None  # required
     byteOffset: Optional[int] = 0
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Sparse(Property):
     count: int = None  # required
     indices: AccessorSparseIndices = None  # required
@@ -348,7 +709,7 @@ class Sparse(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Accessor(Property):
     bufferView: Optional[int] = None
     byteOffset: Optional[int] = 0
@@ -361,9 +722,47 @@ class Accessor(Property):
     min: Optional[List[float]] = field(default_factory=list)
     name: Optional[str] = None
 
+    def compute_min_max(self, data, byte_stride=None):
+        """
+        Set min and max from the accessor's data, one value per component.
+
+        Uses numpy when it is installed. Sparse substitution and matrix column padding are not applied.
+
+        Args:
+            data (bytes-like): the contents of the bufferView this accessor reads from
+            byte_stride (int): the bufferView's byteStride, if it has one
+
+        Returns:
+            (min, max): the new min and max lists
+        """
+        components = ACCESSOR_TYPE_COMPONENTS[self.type]
+        component_format = COMPONENT_TYPE_FORMATS[self.componentType]
+        element = ACCESSOR_STRUCTS[self.componentType, self.type]
+        element_size = element.size
+        component_size = element_size // components
+        stride = byte_stride or element_size
+        offset = self.byteOffset or 0
+        np = _numpy()
+        if np is not None:
+            values = np.ndarray(
+                (self.count, components), dtype="<" + component_format, buffer=data, offset=offset,
+                strides=(stride, component_size),
+            )
+            self.min = values.min(axis=0).tolist()
+            self.max = values.max(axis=0).tolist()
+            return self.min, self.max
+        if stride == element_size:
+            rows = element.iter_unpack(memoryview(data)[offset: offset + self.count * element_size])
+        else:
+            rows = (element.unpack_from(data, offset + i * stride) for i in range(self.count))
+        columns = list(zip(*rows))
+        self.min = [min(column) for column in columns]
+        self.max = [max(column) for column in columns]
+        return self.min, self.max
+
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BufferView(Property):
     buffer: int = None
     byteOffset: Optional[int] = 0
@@ -374,14 +773,14 @@ class BufferView(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Buffer(Property):
     uri: Optional[str] = None
     byteLength: int = None
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Perspective(Property):
     aspectRatio: Optional[float] = None
     yfov: float = None  # required
@@ -390,7 +789,7 @@ class Perspective(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Orthographic(Property):
     xmag: float = None  # required
     ymag: float = None  # required
@@ -399,7 +798,7 @@ class Orthographic(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Camera(Property):
     perspective: Optional[Perspective] = None
     orthographic: Optional[Orthographic] = None
@@ -408,14 +807,14 @@ class Camera(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TextureInfo(Property):
     index: int = None  # required
     texCoord: Optional[int] = 0
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class OcclusionTextureInfo(Property):
     index: Optional[int] = None
     texCoord: Optional[int] = None
@@ -423,7 +822,7 @@ class OcclusionTextureInfo(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class NormalMaterialTexture(Property):
     index: Optional[int] = None
     texCoord: Optional[int] = None
@@ -431,7 +830,7 @@ class NormalMaterialTexture(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class PbrMetallicRoughness(Property):
     baseColorFactor: Optional[List[float]] = field(
         default_factory=lambda: [1.0, 1.0, 1.0, 1.0]
@@ -443,7 +842,7 @@ class PbrMetallicRoughness(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Material(Property):
     pbrMetallicRoughness: Optional[PbrMetallicRoughness] = None
     normalTexture: Optional[NormalMaterialTexture] = None
@@ -459,7 +858,7 @@ class Material(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Sampler(Property):
     """
     Samplers are stored in the samplers array of the asset.
@@ -476,7 +875,7 @@ class Sampler(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Node(Property):
     mesh: Optional[int] = None
     skin: Optional[int] = None
@@ -490,7 +889,7 @@ class Node(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Skin(Property):
     inverseBindMatrices: Optional[int] = None
     skeleton: Optional[int] = None
@@ -499,14 +898,14 @@ class Skin(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Scene(Property):
     name: Optional[str] = None
     nodes: Optional[List[int]] = field(default_factory=list)
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Texture(Property):
     sampler: Optional[int] = None
     source: Optional[int] = None
@@ -514,7 +913,7 @@ class Texture(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Image(Property):
     uri: str = None
     mimeType: str = None
@@ -536,14 +935,14 @@ class Image(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AnimationChannelTarget(Property):
     node: Optional[int] = None
     path: str = None  # required
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AnimationSampler(Property):
     input: int = None  # required
     interpolation: Optional[str] = ANIM_LINEAR
@@ -551,15 +950,34 @@ class AnimationSampler(Property):
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AnimationChannel(Property):
     sampler: int = None  # required
     target: AnimationChannelTarget = None  # required
 
 
 @dataclass_json
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Animation(Property):
     name: Optional[str] = None
     channels: List[AnimationChannel] = field(default_factory=list)
     samplers: List[AnimationSampler] = field(default_factory=list)
+
+
+# str fields whose values are usually one of the constants above. gltf_fromdict replaces decoded values with the
+# constant itself, so thousands of accessors share one "VEC3" instead of holding a copy each.
+_CONSTANT_FIELDS = {
+    Accessor: ("type",),
+    AnimationChannelTarget: ("path",),
+    AnimationSampler: ("interpolation",),
+    Camera: ("type",),
+    Image: ("mimeType",),
+    Material: ("alphaMode",),
+}
+_CONSTANTS = {
+    value: value
+    for value in (
+        [SCALAR, VEC2, VEC3, VEC4, MAT2, MAT3, MAT4] + ANIMATION_CHANNEL_TARGET_PATHS
+        + [ANIM_LINEAR, ANIM_STEP, ANIM_CUBICSPLINE] + CAMERA_TYPES + IMAGE_MIMETYPES + MATERIAL_ALPHAMODES
+    )
+}
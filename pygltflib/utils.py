@@ -238,10 +238,8 @@ def add_indexed_geometry(gltf, indices, vertices):
     stream = "data:application/octet-stream;base64,"
     buffer.uri = stream  # first part of the datastream is set up
 
-    chunk = b""
-    pack = "<HHH"
-    for v in indices:
-        chunk += struct.pack(pack, *v)
+    pack = ACCESSOR_STRUCTS[UNSIGNED_SHORT, VEC3].pack  # "<HHH"
+    chunk = b"".join([pack(*v) for v in indices])
 
     bufferView1.buffer = buffer_index
     bufferView1.byteOffset = 0
@@ -252,10 +250,8 @@ def add_indexed_geometry(gltf, indices, vertices):
     # DH: we do not need this line.
     # byte_length += 4 - byte_length % 4  # pad to next chunk
 
-    chunk = b""
-    pack = "<fff"
-    for v in vertices:
-        chunk += struct.pack(pack, *v)
+    pack = ACCESSOR_STRUCTS[FLOAT, VEC3].pack  # "<fff"
+    chunk = b"".join([pack(*v) for v in vertices])
 
     # record_size = byte_length * num_of_fields
     bufferView2.buffer = buffer_index
@@ -31,6 +31,10 @@ setuptools.setup(
         "dataclasses-json>=0.0.25",
         "deprecated"
     ],
+    extras_require={
+        "fast": ["orjson", "pybase64"],
+        "numpy": ["numpy"],
+    },
     python_requires=">=3.6",
     classifiers=[
         "Programming Language :: Python :: 3",
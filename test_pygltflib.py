@@ -13,12 +13,17 @@ A single test class:
 pytest test_pygltflib.py::TextValidator
 """
 
+import array
 import base64
 from dataclasses import dataclass
+from datetime import datetime
+import json
 import logging
 import os
 from pathlib import Path
 import shutil
+import struct
+import sys
 import tempfile
 
 import pytest
@@ -26,6 +31,7 @@ import pytest
 import pygltflib
 from pygltflib import (
     ARRAY_BUFFER,
+    DATA_URI_HEADER,
     ELEMENT_ARRAY_BUFFER,
     FLOAT,
     SCALAR,
@@ -35,6 +41,7 @@ from pygltflib import (
     VEC3,
     Accessor,
     AccessorSparseIndices,
+    AccessorSparseValues,
     Attributes,
     Buffer,
     BufferFormat,
@@ -481,6 +488,26 @@ class TestAttributes:
         assert attributes.POSITION == 1
         assert attributes._MYCUSTOMATTRIBUTE == 124
 
+    def test_attribute_shared(self):
+        attributes = Attributes(POSITION=0, NORMAL=1)
+        mesh = Mesh(primitives=[Primitive(attributes=attributes), Primitive(attributes=attributes, targets=[attributes])])
+        gltf = GLTF2(meshes=[mesh])
+        data = pygltflib.gltf_todict(gltf)
+        primitives = data["meshes"][0]["primitives"]
+        assert primitives[0]["attributes"] == primitives[1]["attributes"] == {"POSITION": 0, "NORMAL": 1}
+        assert primitives[1]["targets"] == [{"POSITION": 0, "NORMAL": 1}]
+        assert gltf_to_json(gltf).count('"NORMAL": 1') == 3
+
+    def test_attribute_from_json(self):
+        gltf = GLTF2.from_json('{"meshes": [{"primitives": [{"attributes": {"POSITION": 0, "_X": 2}, '
+                               '"targets": [{"POSITION": 1}]}, {"attributes": {}}]}]}')
+        first, second = gltf.meshes[0].primitives
+        assert type(first.attributes) is Attributes
+        assert first.attributes.POSITION == 0 and first.attributes._X == 2
+        assert first.targets == [{"POSITION": 1}]
+        assert second.attributes == {}
+        assert GLTF2.from_json('{"meshes": null}').meshes is None
+
 
 class TestBuffers:
     def test_buffer_datauri_load_gltf(self):
@@ -514,6 +541,27 @@ class TestBuffers:
 
        # assert glb.binary_blob() == reference.binary_blob()
 
+    def test_decode_data_uri(self):
+        data = bytes(range(256))
+        encoded = base64.b64encode(data).decode("utf-8")
+        assert GLTF2.decode_data_uri(DATA_URI_HEADER + encoded) == data
+        assert GLTF2.decode_data_uri(DATA_URI_HEADER + base64.encodebytes(data).decode("utf-8")) == data
+        assert GLTF2.decode_data_uri("data:image/png;base64," + encoded, header="data:image/png;base64,") == data
+        with pytest.raises(ValueError):
+            GLTF2.decode_data_uri("data:image/png;base64," + encoded)
+
+    def test_buffers_to_binary_blob_decodes_once(self, monkeypatch):
+        data = bytes(range(12))
+        gltf = GLTF2(buffers=[Buffer(uri=DATA_URI_HEADER + base64.b64encode(data).decode("utf-8"), byteLength=12)],
+                     bufferViews=[BufferView(buffer=0, byteOffset=0, byteLength=6),
+                                  BufferView(buffer=0, byteOffset=8, byteLength=4)])
+        calls = []
+        decode = GLTF2.decode_data_uri
+        monkeypatch.setattr(GLTF2, "decode_data_uri", staticmethod(lambda uri: calls.append(uri) or decode(uri)))
+        assert gltf.buffers_to_binary_blob() == data
+        assert len(calls) == 1
+        assert [(v.byteOffset, v.byteLength) for v in gltf.bufferViews] == [(0, 8), (8, 4)]
+
 
 class TestAccessors:
     def test_accessors(self):
@@ -523,6 +571,43 @@ class TestAccessors:
         gltf.accessors.append(obj)
         assert '"componentType": 5125' in gltf_to_json(gltf)
 
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_compute_min_max(self, monkeypatch, use_numpy):
+        if not use_numpy:
+            monkeypatch.setattr(pygltflib.types, "_numpy", lambda: None)
+        elif pygltflib.types._numpy() is None:
+            pytest.skip("numpy is not installed")
+        vertices = [(0.0, 1.0, -2.0), (4.0, -1.0, 0.5), (1.0, 0.0, 3.0)]
+        data = b"xxxx" + b"".join(struct.pack("<fff", *v) for v in vertices)
+        accessor = Accessor(byteOffset=4, componentType=FLOAT, count=3, type=VEC3)
+        assert accessor.compute_min_max(data) == ([0.0, -1.0, -2.0], [4.0, 1.0, 3.0])
+
+        # interleaved with a padding short after each index
+        data = b"".join(struct.pack("<Hxx", i) for i in (3, 7, 1))
+        accessor = Accessor(componentType=UNSIGNED_SHORT, count=3, type=SCALAR)
+        accessor.compute_min_max(data, byte_stride=4)
+        assert accessor.min == [1]
+        assert accessor.max == [7]
+
+    def test_get_accessor_array(self):
+        if pygltflib.types._numpy() is None:
+            pytest.skip("numpy is not installed")
+        indices = struct.pack("<3H", 0, 1, 2) + b"\0\0"
+        # interleaved position (3 floats) and a padding float
+        vertices = b"".join(struct.pack("<4f", x, x + 0.5, -x, 9.0) for x in (0.0, 1.0, 2.0))
+        gltf = GLTF2(
+            buffers=[Buffer(byteLength=len(indices + vertices))],
+            bufferViews=[BufferView(buffer=0, byteLength=6),
+                         BufferView(buffer=0, byteOffset=8, byteLength=len(vertices), byteStride=16)],
+            accessors=[Accessor(bufferView=0, componentType=UNSIGNED_SHORT, count=3, type=SCALAR),
+                       Accessor(bufferView=1, componentType=FLOAT, count=3, type=VEC3),
+                       Accessor(componentType=FLOAT, count=2, type=VEC3)],
+        )
+        gltf.set_binary_blob(indices + vertices)
+        assert gltf.get_accessor_array(0).tolist() == [0, 1, 2]
+        assert gltf.get_accessor_array(1).tolist() == [[0.0, 0.5, -0.0], [1.0, 1.5, -1.0], [2.0, 2.5, -2.0]]
+        assert gltf.get_accessor_array(2).shape == (2, 3)
+
 
 class TestTextureConvert:
     def test_(self):
@@ -591,6 +676,56 @@ class TestDefaults:
         p2.attributes.POSITION = 2
         assert p1.attributes.POSITION == 1
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need python 3.10")
+    def test_slots(self):
+        assert not hasattr(Node(), "__dict__")
+        assert not hasattr(Accessor(), "__dict__")
+        assert hasattr(Attributes(), "__dict__")  # Attributes allow custom attributes
+
+    def test_custom_data(self):
+        # custom data on glTF objects goes in extras, ad-hoc attributes fail on python 3.10+ (see the changelog)
+        node = Node()
+        node.extras["my_tag"] = 1
+        assert GLTF2.from_json(GLTF2(nodes=[node]).to_json()).nodes[0].extras == {"my_tag": 1}
+        if sys.version_info >= (3, 10):
+            with pytest.raises(AttributeError):
+                node.my_tag = 1
+        else:
+            node.my_tag = 1
+        gltf = GLTF2()
+        gltf.my_tag = 1  # GLTF2 isn't slotted
+
+    def test_save_asset_factory(self):
+        """ Make sure each save gets its own default Asset """
+        g1 = GLTF2()
+        g2 = GLTF2()
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            g1.save(Path(tmpdirname) / "g1.gltf")
+            g1.asset.copyright = "g1"
+            g2.save(Path(tmpdirname) / "g2.gltf")
+        assert g1.asset is not g2.asset
+        assert g2.asset.copyright is None
+
+    def test_save_compact(self):
+        gltf = GLTF2(nodes=[Node(name="n")])
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            pretty, compact = Path(tmpdirname) / "pretty.gltf", Path(tmpdirname) / "compact.gltf"
+            gltf.save(pretty)
+            gltf.save(compact, pretty=False)
+            assert "\n" in pretty.read_text()
+            assert compact.read_text() == gltf.gltf_to_json(separators=(",", ":"), indent=None)
+            assert GLTF2().load(compact).nodes[0].name == "n"
+
+    def test_save_json_restores_buffers(self):
+        gltf = GLTF2(buffers=[Buffer(byteLength=4)])
+        gltf.set_binary_blob(b"\0\1\2\3")
+        buffer = gltf.buffers[0]
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            gltf.save(Path(tmpdirname) / "blob.gltf")
+            assert (Path(tmpdirname) / "blob.bin").read_bytes() == b"\0\1\2\3"
+            assert GLTF2().load(Path(tmpdirname) / "blob.gltf").buffers[0].uri == "blob.bin"
+        assert gltf.buffers[0] is buffer
+        assert buffer.uri is None
 
     def test_accessor(self):
         gltf = GLTF2()
@@ -775,6 +910,19 @@ class TestBufferViews:
         assert self.gltf.accessors[0].sparse.indices.bufferView == 1
         assert self.gltf.accessors[1].sparse.indices.bufferView == 0  # should have prompted a warning
 
+    def test_sparse_values_and_blob(self):
+        gltf = GLTF2(buffers=[Buffer(byteLength=12)])
+        gltf.bufferViews = [BufferView(buffer=0, byteOffset=offset, byteLength=4) for offset in (0, 4, 8)]
+        sparse = Sparse(count=1, values=AccessorSparseValues(bufferView=2))  # no indices
+        gltf.accessors = [Accessor(bufferView=2, sparse=sparse), Accessor()]
+        gltf.set_binary_blob(bytes(range(12)))
+        gltf.remove_bufferView(1)
+        assert gltf.accessors[0].bufferView == 1
+        assert gltf.accessors[0].sparse.values.bufferView == 1
+        assert gltf.accessors[1].bufferView is None
+        assert [bufferView.byteOffset for bufferView in gltf.bufferViews] == [0, 4]
+        assert gltf.binary_blob() == bytes([0, 1, 2, 3, 8, 9, 10, 11])
+
 
 class TestConvertImages:
     def test_from_datauri_to_file_with_name(self):
@@ -893,12 +1041,126 @@ class TestBytesBuffer:
 
         # assert buffer_blob == gltf._glb_data
 
+    def test_buffer_blob_padding_underrun_zero_filled(self):
+        gltf = GLTF2(buffers=[Buffer(byteLength=6)],
+                     bufferViews=[BufferView(buffer=0, byteOffset=3, byteLength=3),
+                                  BufferView(buffer=0, byteOffset=0, byteLength=2)])
+        gltf.set_binary_blob(b"\1\2\3\4\5\6")
+        buffer_blob = gltf.buffers_to_binary_blob()
+        assert buffer_blob == b"\4\5\6\0\1\2\3\4"
+        assert [(v.byteOffset, v.byteLength) for v in gltf.bufferViews] == [(0, 4), (4, 4)]
+        assert len(buffer_blob) == sum(v.byteLength for v in gltf.bufferViews)
+
     def test_buffer_view_byte_length(self):
         #  it is better to use the unpadded size as length for the buffer view:
         # https://gitlab.com/dodgyville/pygltflib/-/blob/87ec1eb2ee44e69c14c41114b69485bbc180005b/pygltflib/__init__.py#L986
         #buffers_to_binary_blob
         pass
 
+    def test_save_to_bytes_restores_buffer_views(self):
+        data = bytes(range(12))
+        buffers = [Buffer(uri=DATA_URI_HEADER + base64.b64encode(data).decode("utf-8"), byteLength=12)]
+        views = [BufferView(buffer=0, byteOffset=2, byteLength=3), BufferView(buffer=0, byteOffset=8, byteLength=4)]
+        gltf = GLTF2(buffers=buffers, bufferViews=list(views))
+        glb = b"".join(gltf.save_to_bytes())
+        assert GLTF2.load_from_bytes(glb).binary_blob() == data[2:6] + data[8:]
+        assert gltf.buffers is buffers
+        assert gltf.bufferViews == views and all(a is b for a, b in zip(gltf.bufferViews, views))
+        assert [(v.buffer, v.byteOffset, v.byteLength) for v in views] == [(0, 2, 3), (0, 8, 4)]
+
+    def test_save_binary_matches_save_to_bytes(self):
+        gltf = GLTF2(buffers=[Buffer(byteLength=12)],
+                     bufferViews=[BufferView(buffer=0, byteLength=8), BufferView(buffer=0, byteOffset=8, byteLength=4)])
+        gltf.set_binary_blob(bytes(range(12)))
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            t = Path(tmpdirname) / "segments.glb"
+            assert gltf.save_binary(t)
+            assert t.read_bytes() == b"".join(gltf.save_to_bytes())
+            assert GLTF2().load(t).binary_blob() == bytes(range(12))
+
+    def test_save_binary_from_bin_file(self):
+        data = bytes(range(16))
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            (Path(tmpdirname) / "buffer.bin").write_bytes(data)
+            gltf = GLTF2(buffers=[Buffer(uri="buffer.bin", byteLength=16)],
+                         bufferViews=[BufferView(buffer=0, byteOffset=12, byteLength=4),
+                                      BufferView(buffer=0, byteOffset=0, byteLength=8)])
+            gltf.save(Path(tmpdirname) / "bin.glb")
+            glb = GLTF2().load(Path(tmpdirname) / "bin.glb")
+        assert glb.binary_blob() == data[12:] + data[:8]
+        assert gltf.buffers[0].uri == "buffer.bin"
+
+    def test_save_binary_closes_bin_maps(self, monkeypatch):
+        # the .bin files are unmapped once saved, so they can be overwritten or deleted (on Windows too)
+        maps = []
+
+        def open_mapped(fname):
+            data = open_mapped.original(fname)
+            maps.append(data)
+            return data
+
+        open_mapped.original = pygltflib._open_mapped
+        monkeypatch.setattr(pygltflib, "_open_mapped", open_mapped)
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            (Path(tmpdirname) / "buffer.bin").write_bytes(bytes(range(16)))
+            gltf = GLTF2(buffers=[Buffer(uri="buffer.bin", byteLength=16)],
+                         bufferViews=[BufferView(buffer=0, byteOffset=0, byteLength=16)])
+            gltf.save(Path(tmpdirname) / "bin.glb", deduplicate=True)
+            gltf.save_to_bytes()
+            gltf.buffers_to_binary_blob()
+            assert len(maps) == 3
+            assert all(data.closed for data in maps)
+            (Path(tmpdirname) / "buffer.bin").unlink()
+
+    def test_save_binary_missing_buffer_data(self):
+        # a buffer without a uri or a glb blob has nothing to pack, its bufferViews are skipped with a warning
+        gltf = GLTF2(buffers=[Buffer(byteLength=4)], bufferViews=[BufferView(buffer=0, byteLength=4)])
+        with pytest.warns(UserWarning, match="Unable to save bufferView None"):
+            glb = GLTF2.load_from_bytes(b"".join(gltf.save_to_bytes()))
+        assert not glb.binary_blob()
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            with pytest.warns(UserWarning):
+                assert gltf.save(Path(tmpdirname) / "missing.glb")
+
+    def test_save_binary_deduplicate(self):
+        gltf = GLTF2(buffers=[Buffer(byteLength=12)],
+                     bufferViews=[BufferView(buffer=0, byteOffset=0, byteLength=4),
+                                  BufferView(buffer=0, byteOffset=4, byteLength=4),
+                                  BufferView(buffer=0, byteOffset=8, byteLength=4)])
+        gltf.set_binary_blob(b"abcdefghabcd")
+        assert len(b"".join(gltf.save_to_bytes())) > len(b"".join(gltf.save_to_bytes(deduplicate=True)))
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            t = Path(tmpdirname) / "deduplicate.glb"
+            gltf.save(t, deduplicate=True)
+            glb = GLTF2().load(t)
+        assert glb.binary_blob() == b"abcdefgh"
+        assert [(v.byteOffset, v.byteLength) for v in glb.bufferViews] == [(0, 4), (4, 4), (0, 4)]
+        assert [(v.byteOffset, v.byteLength) for v in gltf.bufferViews] == [(0, 4), (4, 4), (8, 4)]
+
+    def test_save_binary_deduplicate_keeps_targets_apart(self):
+        # index and vertex data are never shared, even if their bytes match
+        gltf = GLTF2(buffers=[Buffer(byteLength=16)],
+                     bufferViews=[BufferView(buffer=0, byteOffset=0, byteLength=4, target=ELEMENT_ARRAY_BUFFER),
+                                  BufferView(buffer=0, byteOffset=4, byteLength=4, target=ARRAY_BUFFER),
+                                  BufferView(buffer=0, byteOffset=8, byteLength=4, target=ARRAY_BUFFER, byteStride=4),
+                                  BufferView(buffer=0, byteOffset=12, byteLength=4, target=ARRAY_BUFFER)])
+        gltf.set_binary_blob(b"abcd" * 4)
+        glb = GLTF2.load_from_bytes(b"".join(gltf.save_to_bytes(deduplicate=True)))
+        assert glb.binary_blob() == b"abcd" * 3
+        assert [v.byteOffset for v in glb.bufferViews] == [0, 4, 8, 4]
+
+    def test_load_from_bytes_chunks(self):
+        magic, version, length, json_length, json_type, json_blob, _, bin_type, _ = GLTF2().save_to_bytes()
+        extra = struct.pack("<I", 4) + b"XTRA" + b"\0" * 4
+        length = struct.pack("<I", struct.unpack("<I", length)[0] + len(extra) + 4)
+        glb = b"".join([magic, version, length, json_length, json_type, json_blob, extra,
+                        struct.pack("<I", 4), bin_type, b"\1\2\3\4"])
+        with pytest.warns(UserWarning, match="unknown type 'XTRA'"):
+            gltf = GLTF2.load_from_bytes(glb)
+        assert gltf.binary_blob() == b"\1\2\3\4"
+        with pytest.raises(IOError):
+            GLTF2.load_from_bytes(b"glTX" + glb[4:])
+
 
 class TestJSON:
     def test_compact(self):
@@ -916,6 +1178,116 @@ class TestJSON:
   }
 }"""
 
+    def test_empty_keys(self):
+        attributes = Attributes(POSITION=0)
+        attributes._CUSTOM = 1
+        node = Node(name="", children=[], extras={"a": None, "b": [{"c": None}], "d": {}},
+                    extensions={"EXT_test": {"e": None}})
+        mesh = Mesh(primitives=[Primitive(attributes=attributes, targets=[Attributes(NORMAL=1)])])
+        gltf = GLTF2(nodes=[node], meshes=[mesh])
+        data = pygltflib.gltf_todict(gltf)
+        assert data == pygltflib.delete_empty_keys(pygltflib.gltf_asdict(gltf))
+        assert data["nodes"] == [{"extensions": {"EXT_test": {"e": None}}, "extras": {"b": [{}]}}]
+        assert data["meshes"][0]["primitives"][0]["attributes"] == {"POSITION": 0, "_CUSTOM": 1}
+
+    def test_delete_empty_keys_deep(self):
+        data = inner = {}
+        for _ in range(5000):  # deeper than the default recursion limit
+            inner["child"] = {"value": 1, "empty": None}
+            inner = inner["child"]
+        pygltflib.delete_empty_keys(data)
+        assert inner == {"value": 1}
+
+    def test_from_json_bytes(self):
+        data = '{"asset": {"generator": "W\u00fcrfel", "version": "2.0"}, "scene": 0}'.encode("utf-8")
+        for s in (data, bytearray(data), memoryview(data)):
+            gltf = GLTF2.from_json(s)
+            assert gltf.asset.generator == "W\u00fcrfel"
+            assert gltf.scene == 0
+
+    def test_to_json_bytes(self):
+        gltf = GLTF2(scene=0, nodes=[Node(name="W\u00fcrfel", translation=[1.0, 0.5, 0.0])])
+        for separators, indent in ((None, "  "), ((",", ":"), None)):
+            data = gltf.gltf_to_json_bytes(separators=separators, indent=indent)
+            assert type(data) == bytes
+            back = GLTF2.from_json(data)
+            assert back.nodes[0].name == "W\u00fcrfel"
+            assert back.to_json() == GLTF2.from_json(gltf.gltf_to_json(separators, indent)).to_json()
+
+    def test_to_json_matches_json_module(self):
+        # str output is the same with or without orjson installed
+        gltf = GLTF2(scene=0, nodes=[Node(name="Würfel", translation=[1e-7, 1.5e300, 0.0])])
+        data = pygltflib.gltf_todict(gltf)
+        assert gltf.to_json() == json.dumps(data)
+        assert gltf.to_json(separators=(",", ":")) == json.dumps(data, separators=(",", ":"))
+        assert gltf.to_json(indent=2, sort_keys=True) == json.dumps(data, indent=2, sort_keys=True)
+        assert "W\\u00fcrfel" in gltf.gltf_to_json()
+
+    def test_to_json_datetime(self):
+        # orjson writes datetimes itself, without calling default, so to_json never uses it
+        gltf = GLTF2(nodes=[Node(name="Würfel", extras={"dt": datetime(2020, 1, 1)}, translation=[1e-7, 1e16, 0.0])])
+        data = pygltflib.gltf_todict(gltf)
+        assert gltf.to_json(ensure_ascii=False) == json.dumps(data, cls=pygltflib.JsonEncoder, ensure_ascii=False)
+        assert gltf.to_json(ensure_ascii=False, separators=(",", ":")) == \
+            json.dumps(data, cls=pygltflib.JsonEncoder, ensure_ascii=False, separators=(",", ":"))
+        assert json.loads(gltf.gltf_to_json_bytes())["nodes"][0]["extras"] == {"dt": "2020-01-01T00:00:00"}
+        assert json.loads(gltf.gltf_to_json())["nodes"][0]["extras"] == {"dt": "2020-01-01T00:00:00"}
+
+    @pytest.mark.skipif(pygltflib.orjson is None, reason="orjson is not installed")
+    def test_to_json_bytes_keeps_orjson_output(self):
+        # "null" inside a string is not a NaN written out as null, the orjson output is used
+        gltf = GLTF2(nodes=[Node(name="null", translation=[1e-7, 0.0, 0.0])])
+        data = gltf.gltf_to_json_bytes(separators=(",", ":"), indent=None)
+        assert data == pygltflib.orjson.dumps(pygltflib.gltf_todict(gltf))
+        assert b"1e-7" in data  # the json module writes 1e-07
+
+    def test_to_json_nan(self):
+        gltf = GLTF2(nodes=[Node(translation=[float("nan"), 0.0, float("inf")])])
+        with pytest.raises(ValueError):
+            gltf.gltf_to_json()
+        with pytest.raises(ValueError):
+            gltf.gltf_to_json_bytes(separators=(",", ":"), indent=None)
+        assert '[NaN, 0.0, Infinity]' in gltf.to_json()
+        assert '"translation":[NaN,0.0,Infinity]' in gltf.to_json(separators=(",", ":"))
+
+    def test_from_json_types(self):
+        data = '{"accessors": [{"max": [2], "min": [0.5], "count": 3, "sparse": {"count": 1, "indices": {"bufferView": 0}}}],' \
+               '"meshes": [{"primitives": [{"attributes": {"POSITION": 0}}]}], "scene": 0, "unknown": 1}'
+        gltf = GLTF2.from_json(data)
+        accessor = gltf.accessors[0]
+        assert accessor.max == [2.0] and type(accessor.max[0]) == float
+        assert accessor.byteOffset == 0
+        assert type(accessor.sparse.indices) == AccessorSparseIndices
+        assert type(gltf.meshes[0].primitives[0].attributes) == Attributes
+        assert gltf.scene == 0
+
+    def test_from_json_type_hints_cached(self, monkeypatch):
+        # field types are resolved on the first decode of each class, not on every object
+        data = '{"nodes": [{"mesh": 0}], "accessors": [{"max": [1], "sparse": {"count": 1}}], "scenes": [{}]}'
+        GLTF2.from_json(data)
+
+        def get_type_hints(cls):
+            raise AssertionError("type hints resolved again for %s" % cls)
+
+        monkeypatch.setattr(pygltflib.types, "get_type_hints", get_type_hints)
+        gltf = GLTF2.from_json(data)
+        assert gltf.nodes[0].mesh == 0
+        assert gltf.accessors[0].sparse.count == 1
+
+    def test_array_values(self):
+        # numeric fields can be given as array.array or numpy values, they are written out as lists
+        gltf = GLTF2(nodes=[Node(translation=array.array("f", [1.0, 2.5, 0.0]), scale=array.array("f"))])
+        np = pygltflib.types._numpy()
+        if np is not None:
+            gltf.nodes.append(Node(rotation=np.array([0, 0, 0, 1], dtype=np.float32), scale=[np.float32(0.5)] * 3))
+        nodes = GLTF2.from_json(gltf.to_json()).nodes
+        assert nodes[0].translation == [1.0, 2.5, 0.0]
+        assert nodes[0].scale is None
+        if len(nodes) > 1:
+            assert nodes[1].rotation == [0.0, 0.0, 0.0, 1.0]
+            assert nodes[1].scale == [0.5, 0.5, 0.5]
+
+
 class TestExamples:
     def test_a_simple_mesh(self):
         # create gltf objects for a scene with a primitive triangle with indexed geometry